@@ -1,13 +1,13 @@
 import logging
 from pathlib import Path
-from models import DatabaseManager
+from models import get_db
 from manager import BackupManager
 from core import CompressionType
 
 
 def main():
     try:
-        db = DatabaseManager()
+        db = get_db()
         db.create_db()
         logging.info("Database created successfully.")
         docs_path = Path.home() / "Desktop/DataSafe"
@@ -15,7 +15,7 @@ def main():
             docs_path,
             calculate_size=True,
             compressed=True,
-            compression_type=CompressionType.ZIP,  # TAR, TAR_GZ, ZIP
+            compression_type=CompressionType.ZIP,  # TAR, TAR_GZ, TAR_ZST, ZIP
         )
         backup_mgr.save_backup_metadata()
         logging.debug(f"Backup archive: {backup_mgr.backup_archive}")
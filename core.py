@@ -2,17 +2,663 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
-import re
 import tarfile
 import zipfile
 import shutil
 from enum import Enum
+import functools
+import json
 import logging
+import mmap
+import os
+import stat
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import deflate
+except ImportError:
+    deflate = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    from isal import igzip_threaded
+except ImportError:
+    igzip_threaded = None
+
+try:
+    from fastcrc import crc32 as _fastcrc32
+except ImportError:
+    _fastcrc32 = None
+
+if _fastcrc32 is not None:
+    _crc32 = _fastcrc32.iso_hdlc
+elif deflate is not None:
+    _crc32 = deflate.crc32
+else:
+    _crc32 = zlib.crc32
+
+
+_ZIP_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+_ZIP_CENTRAL_HEADER = struct.Struct("<4s6H3L5H2L")
+_ZIP_END_RECORD = struct.Struct("<4s4H2LH")
+_ZIP64_END_RECORD = struct.Struct("<4sQ2H2L4Q")
+_ZIP64_END_LOCATOR = struct.Struct("<4sLQL")
+_ZIP64_LIMIT = 0xFFFFFFFF
+_ZIP_VERSION = 20
+_ZIP64_VERSION = 45
+_SPLIT_SIZE = 64 * 1024 * 1024
+_SPOOL_SIZE = 1024 * 1024
+_DEFLATE_WINDOW = 32 * 1024
+_ZIP_BATCH = 16
+_COPY_BUFSIZE = 1024 * 1024
+_TAR_BUFSIZE = tarfile.RECORDSIZE * 100
+_KERNEL_COPY_CHUNK = 1 << 30
+_STAT_WORKERS = 64
+_STAT_BATCH = 256
+_FICLONE = 0x40049409
+_SAMPLE_SIZE = 64 * 1024
+_SMALL_FILE_SIZE = 16 * 1024
+_LARGE_FILE_SIZE = 4 * 1024 * 1024
+_ZSTD_LEVEL = 3
+_ISAL_LEVEL = 1
+_ISAL_MAX_LEVEL = 3
+_SAMPLE_RATIO = 0.9
+_INCOMPRESSIBLE = {
+    ".jpg",
+    ".jpeg",
+    ".png",
+    ".webp",
+    ".mp4",
+    ".mkv",
+    ".mp3",
+    ".flac",
+    ".zip",
+    ".gz",
+    ".xz",
+    ".zst",
+    ".7z",
+}
+_SAFE_NAME_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?* ', "_"))
+
+
+@functools.lru_cache(maxsize=4096)
+def _safe_name(name: str) -> str:
+    return name.translate(_SAFE_NAME_TABLE)
+
+
+def _dos_datetime(mtime: float) -> tuple[int, int]:
+    t = time.localtime(mtime)
+    if t.tm_year < 1980:
+        return 0, (1 << 5) | 1
+    return (
+        (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2),
+        ((t.tm_year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday,
+    )
+
+
+def _gf2_matrix_times(mat: list, vec: int) -> int:
+    result = 0
+    i = 0
+    while vec:
+        if vec & 1:
+            result ^= mat[i]
+        vec >>= 1
+        i += 1
+    return result
+
+
+def _gf2_matrix_square(mat: list) -> list:
+    return [_gf2_matrix_times(mat, row) for row in mat]
+
+
+def _crc32_combine(crc1: int, crc2: int, len2: int) -> int:
+    """Return the CRC-32 of A + B from crc1 = crc(A), crc2 = crc(B), len(B).
+
+    Port of zlib's crc32_combine(), which Python's zlib does not expose.
+    """
+    if len2 <= 0:
+        return crc1
+    odd = [0xEDB88320] + [1 << n for n in range(31)]
+    even = _gf2_matrix_square(odd)
+    odd = _gf2_matrix_square(even)
+    while True:
+        even = _gf2_matrix_square(odd)
+        if len2 & 1:
+            crc1 = _gf2_matrix_times(even, crc1)
+        len2 >>= 1
+        if not len2:
+            break
+        odd = _gf2_matrix_square(even)
+        if len2 & 1:
+            crc1 = _gf2_matrix_times(odd, crc1)
+        len2 >>= 1
+        if not len2:
+            break
+    return crc1 ^ crc2
+
+
+class _ZipWriter:
+    """Writes ZIP members whose payload has already been compressed."""
+
+    def __init__(self, fileobj):
+        self.fp = fileobj
+        self.central = bytearray()
+        self.count = 0
+        self.buffer = bytearray(_COPY_BUFSIZE)
+
+    def add(
+        self,
+        arcname: str,
+        mode: int,
+        mtime: float,
+        method: int,
+        crc: int,
+        size: int,
+        payload,
+    ):
+        """Write one member whose payload is bytes, a Path or a list of them.
+
+        A stored member given as a Path is the source file itself: the first
+        size bytes are copied and checksummed here, ignoring crc, and the
+        local header is patched afterwards, so a file rewritten after it was
+        scanned still ends up with a CRC that matches the archived bytes.
+        """
+        offset = self.fp.tell()
+        parts = payload if isinstance(payload, list) else [payload]
+        source = method == zipfile.ZIP_STORED and isinstance(payload, Path)
+        compress_size = (
+            size
+            if source
+            else sum(
+                part.stat().st_size if isinstance(part, Path) else len(part)
+                for part in parts
+            )
+        )
+        name = arcname.encode("utf-8")
+        flags = 0x800 if not arcname.isascii() else 0
+        dos_time, dos_date = _dos_datetime(mtime)
+
+        zip64 = size >= _ZIP64_LIMIT or compress_size >= _ZIP64_LIMIT
+        central_fields = []
+        if zip64:
+            central_fields += [size, compress_size]
+        if offset >= _ZIP64_LIMIT:
+            central_fields.append(offset)
+        version = _ZIP64_VERSION if central_fields else _ZIP_VERSION
+
+        def local_header():
+            return (
+                _ZIP_LOCAL_HEADER.pack(
+                    b"PK\x03\x04",
+                    version,
+                    flags,
+                    method,
+                    dos_time,
+                    dos_date,
+                    crc,
+                    _ZIP64_LIMIT if zip64 else compress_size,
+                    _ZIP64_LIMIT if zip64 else size,
+                    len(name),
+                    20 if zip64 else 0,
+                )
+                + name
+                + (
+                    struct.pack("<2H2Q", 0x0001, 16, size, compress_size)
+                    if zip64
+                    else b""
+                )
+            )
+
+        self.fp.write(local_header())
+        if source:
+            crc, size = self._copy_source(payload, size)
+            compress_size = size
+            end = self.fp.tell()
+            self.fp.seek(offset)
+            self.fp.write(local_header())
+            self.fp.seek(end)
+        else:
+            for part in parts:
+                if isinstance(part, Path):
+                    self._copy_part(part)
+                else:
+                    self.fp.write(part)
+
+        if zip64:
+            central_fields[:2] = [size, compress_size]
+        central_extra = (
+            struct.pack(
+                f"<2H{len(central_fields)}Q",
+                0x0001,
+                8 * len(central_fields),
+                *central_fields,
+            )
+            if central_fields
+            else b""
+        )
+        self.central += _ZIP_CENTRAL_HEADER.pack(
+            b"PK\x01\x02",
+            (3 << 8) | version,
+            version,
+            flags,
+            method,
+            dos_time,
+            dos_date,
+            crc,
+            _ZIP64_LIMIT if zip64 else compress_size,
+            _ZIP64_LIMIT if zip64 else size,
+            len(name),
+            len(central_extra),
+            0,
+            0,
+            0,
+            ((mode & 0xFFFF) << 16) | (0x10 if arcname.endswith("/") else 0),
+            min(offset, _ZIP64_LIMIT),
+        )
+        self.central += name
+        self.central += central_extra
+        self.count += 1
+
+    def _copy_source(self, path: Path, size: int) -> tuple[int, int]:
+        # Copy at most the size the file was scanned at; a file that grew
+        # since is archived as that prefix, one that shrank as what is left.
+        view = memoryview(self.buffer)
+        crc = copied = 0
+        with open(path, "rb", buffering=0) as f:
+            while copied < size and (
+                n := f.readinto(view[: min(size - copied, len(view))])
+            ):
+                crc = _crc32(view[:n], crc)
+                self.fp.write(view[:n])
+                copied += n
+        return crc, copied
+
+    def _copy_part(self, path: Path):
+        with open(path, "rb") as f:
+            shutil.copyfileobj(f, self.fp, _COPY_BUFSIZE)
+
+    def close(self):
+        cd_offset = self.fp.tell()
+        cd_size = len(self.central)
+        self.fp.write(self.central)
+        if self.count >= 0xFFFF or cd_offset >= _ZIP64_LIMIT or cd_size >= _ZIP64_LIMIT:
+            end64_offset = self.fp.tell()
+            self.fp.write(
+                _ZIP64_END_RECORD.pack(
+                    b"PK\x06\x06",
+                    _ZIP64_END_RECORD.size - 12,
+                    (3 << 8) | _ZIP64_VERSION,
+                    _ZIP64_VERSION,
+                    0,
+                    0,
+                    self.count,
+                    self.count,
+                    cd_size,
+                    cd_offset,
+                )
+            )
+            self.fp.write(_ZIP64_END_LOCATOR.pack(b"PK\x06\x07", 0, end64_offset, 1))
+        self.fp.write(
+            _ZIP_END_RECORD.pack(
+                b"PK\x05\x06",
+                0,
+                0,
+                min(self.count, 0xFFFF),
+                min(self.count, 0xFFFF),
+                min(cd_size, _ZIP64_LIMIT),
+                min(cd_offset, _ZIP64_LIMIT),
+                0,
+            )
+        )
+
+
+_read_buffer = bytearray(_COPY_BUFSIZE)
+
+
+def _zlib_compressor(level: int):
+    return zlib.compressobj(min(level, 9), zlib.DEFLATED, -15)
+
+
+def _scandir(path) -> list:
+    with os.scandir(path) as it:
+        return list(it)
+
+
+def _walk(path):
+    """Yield (DirEntry, relative path) for everything below path.
+
+    Directories come before their contents. DirEntry caches its stat()
+    result, so callers reusing the entries do not pay for another syscall
+    per file. The walk keeps an explicit stack of directory listings
+    rather than nesting generators, so yielding an entry costs the same at
+    any depth.
+    """
+    stack = [(iter(_scandir(path)), "")]
+    while stack:
+        entries, prefix = stack[-1]
+        entry = next(entries, None)
+        if entry is None:
+            stack.pop()
+            continue
+        rel = prefix + entry.name
+        yield entry, rel
+        if entry.is_dir(follow_symlinks=False):
+            # Like Path.rglob(), leave out directories that cannot be listed
+            # rather than failing the whole walk.
+            try:
+                children = _scandir(entry.path)
+            except PermissionError as e:
+                logging.warning(f"Skipping unreadable directory: {e}")
+                continue
+            stack.append((iter(children), rel + "/"))
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, offset: int) -> int:
+    return os.copy_file_range(src_fd, dst_fd, _KERNEL_COPY_CHUNK)
+
+
+def _sendfile(src_fd: int, dst_fd: int, offset: int) -> int:
+    return os.sendfile(dst_fd, src_fd, offset, _KERNEL_COPY_CHUNK)
+
+
+_KERNEL_COPIES = ((_copy_file_range,) if hasattr(os, "copy_file_range") else ()) + (
+    (_sendfile,) if hasattr(os, "sendfile") else ()
+)
+
+
+def _copy_file_data(fsrc, fdst):
+    # Try a reflink clone first, then in-kernel copies, and only then a
+    # user-space copy, resuming from wherever the previous method stopped.
+    src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+    if fcntl is not None:
+        try:
+            fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+            return
+        except OSError:
+            pass
+    copied = 0
+    for kernel_copy in _KERNEL_COPIES:
+        try:
+            while n := kernel_copy(src_fd, dst_fd, copied):
+                copied += n
+        except OSError:
+            continue
+        if copied:
+            return
+    fsrc.seek(copied)
+    fdst.seek(copied)
+    shutil.copyfileobj(fsrc, fdst, _COPY_BUFSIZE)
+
+
+def _copy_file(src: str, dst: str):
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        _copy_file_data(fsrc, fdst)
+    shutil.copystat(src, dst)
+
+
+def _fast_copytree(src: Path, dst: Path, entries: Optional[list] = None):
+    """Copy the tree at src to dst, copying files on a thread pool.
+
+    Like shutil.copytree(), errors on single entries are collected and
+    raised together as shutil.Error once everything else is copied.
+    """
+    if entries is None:
+        entries = _walk(src)
+    os.makedirs(dst)
+    dirs = [(str(src), str(dst))]
+    errors = []
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        futures = {}
+        for entry, rel in entries:
+            target = os.path.join(dst, rel)
+            if entry.is_dir(follow_symlinks=False):
+                os.mkdir(target)
+                dirs.append((entry.path, target))
+                continue
+            if entry.is_dir():
+                future = executor.submit(shutil.copytree, entry.path, target)
+                futures[future] = entry.path, target
+                continue
+            try:
+                st = entry.stat()
+            except OSError as e:
+                errors.append((entry.path, target, str(e)))
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                # Opening a FIFO or device would block or read forever.
+                errors.append(
+                    (entry.path, target, f"'{entry.path}' is not a regular file")
+                )
+            else:
+                future = executor.submit(_copy_file, entry.path, target)
+                futures[future] = entry.path, target
+        for future, (src_path, target) in futures.items():
+            try:
+                future.result()
+            except shutil.Error as e:
+                errors.extend(e.args[0])
+            except OSError as e:
+                errors.append((src_path, target, str(e)))
+    for src_dir, dst_dir in reversed(dirs):
+        try:
+            shutil.copystat(src_dir, dst_dir)
+        except OSError as e:
+            errors.append((src_dir, dst_dir, str(e)))
+    if errors:
+        raise shutil.Error(errors)
+
+
+def _tar_add_sendfile(tar: tarfile.TarFile, path: str, arcname: str):
+    """Add path to an uncompressed tar, copying file data in the kernel.
+
+    Mirrors TarFile.addfile(), but the member data goes straight from the
+    source file to the archive with os.sendfile().
+    """
+    tarinfo = tar.gettarinfo(path, arcname)
+    if not tarinfo.isreg() or tarinfo.size == 0:
+        tar.addfile(tarinfo)
+        return
+    with open(path, "rb") as f:
+        buf = tarinfo.tobuf(tar.format, tar.encoding, tar.errors)
+        tar.fileobj.write(buf)
+        tar.fileobj.flush()
+        out_fd, in_fd = tar.fileobj.fileno(), f.fileno()
+        sent = 0
+        while sent < tarinfo.size and (
+            n := os.sendfile(out_fd, in_fd, sent, tarinfo.size - sent)
+        ):
+            sent += n
+        tar.fileobj.seek(0, os.SEEK_END)
+    if sent < tarinfo.size:
+        raise tarfile.ReadError(f"unexpected end of data in {path}")
+    blocks, remainder = divmod(tarinfo.size, tarfile.BLOCKSIZE)
+    if remainder:
+        tar.fileobj.write(tarfile.NUL * (tarfile.BLOCKSIZE - remainder))
+        blocks += 1
+    tar.offset += len(buf) + blocks * tarfile.BLOCKSIZE
+    tar.members.append(tarinfo)
+
+
+def _entry_size(entry: os.DirEntry) -> int:
+    return entry.stat().st_size if entry.is_file(follow_symlinks=False) else 0
+
+
+def _entries_size(entries: list) -> int:
+    return sum(_entry_size(entry) for entry, _ in entries)
+
+
+def _zlib_deflate(path: str, level: int):
+    compressor = _zlib_compressor(level)
+    view = memoryview(_read_buffer)
+    crc = size = 0
+    pieces = []
+    with open(path, "rb", buffering=0) as f:
+        while n := f.readinto(_read_buffer):
+            chunk = view[:n]
+            crc = _crc32(chunk, crc)
+            size += n
+            pieces.append(compressor.compress(chunk))
+        pieces.append(compressor.flush())
+    return crc, size, b"".join(pieces)
+
+
+def _deflate_part(
+    path: str, offset: int, length: int, last: bool, level: int, spooled: Path
+):
+    # Parts of one member are raw deflate streams that can be concatenated:
+    # every part but the last ends on a byte boundary with Z_SYNC_FLUSH
+    # instead of a final block, and each part is primed with the previous
+    # 32 KiB as its dictionary, the same way pigz splits a single stream.
+    with open(path, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as buf, memoryview(buf) as view, view[offset : offset + length] as chunk:
+        if offset:
+            compressor = zlib.compressobj(
+                min(level, 9),
+                zlib.DEFLATED,
+                -15,
+                zdict=buf[max(0, offset - _DEFLATE_WINDOW) : offset],
+            )
+        else:
+            compressor = _zlib_compressor(level)
+        crc = _crc32(chunk)
+        size = len(chunk)
+        with open(spooled, "wb") as out:
+            out.write(compressor.compress(chunk))
+            out.write(compressor.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH))
+    return crc, size, spooled
+
+
+def _member_level(level: Optional[int], file_size: int) -> int:
+    # Without an explicit level, large files take the fast level 1 (most of
+    # the archive's bytes, least of its ratio), small ones the strongest.
+    if level is not None:
+        return level
+    if file_size > _LARGE_FILE_SIZE:
+        return 1
+    if file_size > _SMALL_FILE_SIZE:
+        return 6
+    return 9
+
+
+def _is_compressible(path: str, level: int) -> bool:
+    with open(path, "rb") as f:
+        sample = f.read(_SAMPLE_SIZE)
+    if deflate is not None:
+        compressed = deflate.deflate_compress(sample, level)
+    else:
+        compressed = zlib.compress(sample, min(level, 9), wbits=-15)
+    return len(compressed) < len(sample) * _SAMPLE_RATIO
+
+
+def _deflate_one(task: tuple) -> tuple:
+    """Compress a single archive member or part; runs inside a worker process.
+
+    Members are deflated in memory with libdeflate, or with zlib when the
+    binding is missing, and returned as bytes; a result larger than
+    _SPOOL_SIZE is written to spool_dir and returned as a Path instead, so
+    results waiting for the writer stay small. Files larger than
+    _SPLIT_SIZE arrive as several tasks, one per part, each deflated into
+    spool_dir and returned as a Path; the last tuple field tells the
+    writer whether the member is complete.
+
+    Files that will not shrink, judged by extension or by deflating a
+    64 KiB sample, are stored as-is: they are returned as their own source
+    Path and the writer checksums them while copying.
+    """
+    idx, path, arcname, mode, mtime, file_size, level, spool_dir, part = task
+    level = _member_level(level, file_size)
+    if part is not None:
+        offset, length, last = part
+        crc, size, payload = _deflate_part(
+            path, offset, length, last, level, Path(spool_dir) / f"{idx}.{offset}"
+        )
+        return idx, arcname, mode, mtime, zipfile.ZIP_DEFLATED, crc, size, payload, last
+    if stat.S_ISDIR(mode):
+        return idx, arcname + "/", mode, mtime, zipfile.ZIP_STORED, 0, 0, b"", True
+    if file_size == 0:
+        return idx, arcname, mode, mtime, zipfile.ZIP_STORED, 0, 0, b"", True
+    if os.path.splitext(path)[1].lower() in _INCOMPRESSIBLE or (
+        file_size > _SAMPLE_SIZE and not _is_compressible(path, level)
+    ):
+        crc, size, payload = 0, file_size, Path(path)
+        return idx, arcname, mode, mtime, zipfile.ZIP_STORED, crc, size, payload, True
+    if deflate is None:
+        crc, size, payload = _zlib_deflate(path, level)
+    else:
+        with open(path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as buf:
+            crc = _crc32(buf)
+            size = len(buf)
+            payload = deflate.deflate_compress(buf, level)
+    if len(payload) >= size:
+        crc, payload = 0, Path(path)
+        return idx, arcname, mode, mtime, zipfile.ZIP_STORED, crc, size, payload, True
+    if len(payload) > _SPOOL_SIZE:
+        spooled = Path(spool_dir) / str(idx)
+        spooled.write_bytes(payload)
+        payload = spooled
+    return idx, arcname, mode, mtime, zipfile.ZIP_DEFLATED, crc, size, payload, True
+
+
+def _deflate_batch(batch: list) -> list:
+    return [_deflate_one(task) for task in batch]
+
+
+def _bounded_map(executor, fn, iterable, limit: int):
+    """Like executor.map(), but with at most limit calls in flight.
+
+    executor.map() submits the whole iterable up front, so results that the
+    writer has not consumed yet would pile up in memory.
+    """
+    pending = deque()
+    for item in iterable:
+        if len(pending) >= limit:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, item))
+    while pending:
+        yield pending.popleft().result()
+
+
+def _batch_tasks(tasks):
+    # Whole members travel to the workers in batches to save round trips;
+    # parts of split files go one per batch so they spread across workers.
+    batch = []
+    for task in tasks:
+        if task[-1] is not None:
+            if batch:
+                yield batch
+                batch = []
+            yield [task]
+            continue
+        batch.append(task)
+        if len(batch) == _ZIP_BATCH:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
 
 
 class CompressionType(Enum):
     TAR = "tar"
     TAR_GZ = "tar.gz"
+    TAR_ZST = "tar.zst"
     ZIP = "zip"
 
     @classmethod
@@ -20,34 +666,78 @@ class CompressionType(Enum):
         return value in cls._value2member_map_
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceDirectory:
     path: Path
     name: str = field(init=False)
-    size: Optional[int] = field(init=False, default=None)
+    _size: Optional[int] = field(init=False, default=None)
     date: datetime = field(init=False)
     calculate_size: bool = True
+    entries: Optional[list] = field(init=False, default=None)
+    path_stat: Optional[os.stat_result] = field(init=False, default=None)
 
     def __post_init__(self):
-        if not self.path.exists() or not self.path.is_dir():
+        try:
+            self.path_stat = self.path.stat()
+        except OSError:
+            self.path_stat = None
+        if self.path_stat is None or not stat.S_ISDIR(self.path_stat.st_mode):
             logging.error(f"Directory: '{self.path}' is not a valid directory.")
             raise ValueError(f"Directory: '{self.path}' is not a valid directory.")
         self.name = self._make_safe_name(self.path.name)
         try:
-            self.date = datetime.fromtimestamp(self.path.stat().st_mtime)
+            self.date = datetime.fromtimestamp(self.path_stat.st_mtime)
         except Exception as e:
             logging.error(f"Could not get modification date: {e}")
             self.date = datetime.now().replace(microsecond=0)
-        self.size = self._get_size() if self.calculate_size else None
 
     @staticmethod
     def _make_safe_name(name: str) -> str:
-        name = name.replace(" ", "_")
-        return re.sub(r'[<>:"/\\|?*]', "_", name)
+        return _safe_name(name)
+
+    def walk(self):
+        """Yield (DirEntry, relative path, size) for everything in the tree.
+
+        The tree is only read from disk once; later walks replay the cached
+        entries. A complete walk also fills in size when calculate_size is
+        set, so archiving the tree calculates its size for free.
+        """
+        if self.entries is not None:
+            for entry, rel in self.entries:
+                yield entry, rel, _entry_size(entry)
+            return
+        entries = []
+        total = 0
+        for entry, rel in _walk(self.path):
+            entries.append((entry, rel))
+            size = _entry_size(entry)
+            total += size
+            yield entry, rel, size
+        self.entries = entries
+        if self.calculate_size:
+            self._size = total
+
+    @property
+    def size(self) -> Optional[int]:
+        if self._size is None and self.calculate_size:
+            self._size = self._get_size()
+        return self._size
 
     def _get_size(self) -> int:
         try:
-            return sum(f.stat().st_size for f in self.path.rglob("*") if f.is_file())
+            if self.entries is not None:
+                return _entries_size(self.entries)
+            # Listing is serial, but the stat() calls are batched across
+            # threads so per-call latency overlaps on network filesystems.
+            entries = list(_walk(self.path))
+            batches = [
+                entries[i : i + _STAT_BATCH]
+                for i in range(0, len(entries), _STAT_BATCH)
+            ]
+            with ThreadPoolExecutor(max_workers=_STAT_WORKERS) as executor:
+                total = sum(executor.map(_entries_size, batches))
+            self.entries = entries
+            return total
         except Exception as e:
             logging.error(f"Error calculating directory size: {e}")
             return 0
@@ -65,7 +755,7 @@ class SourceDirectory:
         return self.__repr__()
 
 
-@dataclass
+@dataclass(slots=True)
 class BackupArchive:
     source: SourceDirectory
     compressed: bool
@@ -73,8 +763,14 @@ class BackupArchive:
     backup_name: Optional[str] = None
     backup_date: datetime = field(default_factory=datetime.now)
     compression_type: CompressionType = CompressionType.ZIP
+    compression_level: Optional[int] = None
+    previous_files: Optional[dict] = None
     compressed_size: Optional[int] = field(init=False, default=None)
     backup_file: Optional[Path] = field(init=False, default=None)
+    backup_stat: Optional[os.stat_result] = field(init=False, default=None)
+    _date_str: str = field(init=False, default="")
+    files: Optional[list] = field(init=False, default=None)
+    unchanged: set = field(init=False, default_factory=set)
 
     def __post_init__(self):
         if self.compressed and not CompressionType.has_value(
@@ -84,38 +780,101 @@ class BackupArchive:
                 f"Unsupported compression type: {self.compression_type.value}."
                 f"Supported: {[c.value for c in CompressionType]}"
             )
+        if (
+            self.compressed
+            and self.compression_type == CompressionType.TAR_ZST
+            and zstandard is None
+        ):
+            raise ValueError("Compression type tar.zst requires 'zstandard'.")
         try:
             self.backup_path.mkdir(parents=True, exist_ok=True)
             logging.debug(f"Created backup path: {self.backup_path}")
         except Exception as e:
             logging.error(f"Failed to create backup path: {e}")
             raise
+        self._date_str = time.strftime("%Y-%m-%d-%H%M%S", self.backup_date.timetuple())
         self.backup_name = self._make_backup_name()
         self.backup_file = self._get_backup_file_path()
+        if self.previous_files is not None:
+            self.files = []
 
         if self.compressed:
             try:
                 self._compress()
+                if self.files is not None:
+                    self._write_manifest()
+                self.backup_stat = self._stat_backup_file()
                 self.compressed_size = (
-                    self.backup_file.stat().st_size
-                    if self.backup_file.exists()
-                    else None
+                    self.backup_stat.st_size if self.backup_stat else None
                 )
             except Exception as e:
                 logging.error(f"Compression failed: {e}")
                 self.compressed_size = None
+                self.files = None
         else:
             try:
                 self._move()
+                if self.files is not None:
+                    self._write_manifest()
                 self.compressed_size = None
             except Exception as e:
                 logging.error(f"Move failed: {e}")
                 self.compressed_size = None
+                self.files = None
+
+    def _archive_entries(self):
+        for entry, rel, _ in self.source.walk():
+            if self.files is not None and entry.is_file():
+                st = entry.stat()
+                self.files.append((rel, st.st_mtime_ns, st.st_size))
+                if self.previous_files.get(rel) == (st.st_mtime_ns, st.st_size):
+                    self.unchanged.add(rel)
+                    continue
+            yield entry, rel
+
+    def _add_to_tar(self, tar: tarfile.TarFile, sendfile: bool = False):
+        tar.add(str(self.source.path), arcname=self.source.name, recursive=False)
+        prefix = self.source.name + "/"
+        for entry, rel in self._archive_entries():
+            if sendfile:
+                _tar_add_sendfile(tar, entry.path, prefix + rel)
+            else:
+                tar.add(entry.path, arcname=prefix + rel, recursive=False)
+        logging.debug(f"Added {self.source.path} to archive")
+
+    def _write_manifest(self):
+        manifest = self.backup_path / f"{self.backup_file.name}.manifest.json"
+        with open(manifest, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "source": str(self.source.path),
+                    "files": [
+                        {
+                            "path": rel,
+                            "mtime_ns": mtime_ns,
+                            "size": size,
+                            "changed": rel not in self.unchanged,
+                        }
+                        for rel, mtime_ns, size in self.files
+                    ],
+                },
+                f,
+            )
+        logging.debug(
+            f"Wrote manifest {manifest}: {len(self.files) - len(self.unchanged)} "
+            f"of {len(self.files)} files changed since the previous backup"
+        )
+
+    def _stat_backup_file(self) -> Optional[os.stat_result]:
+        try:
+            return self.backup_file.stat()
+        except FileNotFoundError:
+            return None
 
     def _make_backup_name(self) -> str:
         base_name = self.backup_name or self.source.name
         safe_name = SourceDirectory._make_safe_name(base_name)
-        return f"{safe_name}-{self.backup_date.strftime('%Y-%m-%d-%H%M%S')}"
+        return f"{safe_name}-{self._date_str}"
 
     def _get_backup_file_path(self) -> Path:
         if self.backup_name is None:
@@ -129,33 +888,129 @@ class BackupArchive:
 
     def _compress(self):
         if self.compression_type == CompressionType.TAR:
-            with tarfile.open(str(self.backup_file), "w") as tar:
-                tar.add(str(self.source.path), arcname=self.source.name)
-                logging.debug(f"Added {self.source.path} to archive")
+            with tarfile.open(
+                str(self.backup_file), "w", copybufsize=_COPY_BUFSIZE
+            ) as tar:
+                # Only Linux sendfile() accepts a regular file as out_fd.
+                self._add_to_tar(tar, sendfile=sys.platform.startswith("linux"))
+        elif self.compression_type == CompressionType.TAR_GZ and igzip_threaded:
+            level = (
+                _ISAL_LEVEL
+                if self.compression_level is None
+                else min(self.compression_level, _ISAL_MAX_LEVEL)
+            )
+            with igzip_threaded.open(
+                self.backup_file, "wb", compresslevel=level, threads=os.cpu_count()
+            ) as gz, tarfile.open(
+                fileobj=gz,
+                mode="w|",
+                bufsize=_TAR_BUFSIZE,
+                copybufsize=_COPY_BUFSIZE,
+            ) as tar:
+                self._add_to_tar(tar)
         elif self.compression_type == CompressionType.TAR_GZ:
-            with tarfile.open(str(self.backup_file), "w:gz") as tar:
-                tar.add(str(self.source.path), arcname=self.source.name)
-                logging.debug(f"Added {self.source.path} to archive")
+            with tarfile.open(
+                str(self.backup_file),
+                "w:gz",
+                compresslevel=(
+                    9
+                    if self.compression_level is None
+                    else min(self.compression_level, 9)
+                ),
+                copybufsize=_COPY_BUFSIZE,
+            ) as tar:
+                self._add_to_tar(tar)
+        elif self.compression_type == CompressionType.TAR_ZST:
+            cctx = zstandard.ZstdCompressor(
+                level=(
+                    _ZSTD_LEVEL
+                    if self.compression_level is None
+                    else self.compression_level
+                ),
+                threads=-1,
+            )
+            with open(self.backup_file, "wb") as raw, cctx.stream_writer(
+                raw
+            ) as zfh, tarfile.open(
+                fileobj=zfh,
+                mode="w|",
+                bufsize=_TAR_BUFSIZE,
+                copybufsize=_COPY_BUFSIZE,
+            ) as tar:
+                self._add_to_tar(tar)
         elif self.compression_type == CompressionType.ZIP:
-            with zipfile.ZipFile(
-                str(self.backup_file), "w", zipfile.ZIP_DEFLATED
-            ) as zipf:
-                for file in self.source.path.rglob("*"):
-                    arcname = str(
-                        Path(self.source.name) / file.relative_to(self.source.path)
-                    )
-                    zipf.write(str(file), arcname=arcname)
-                    logging.debug(f"Added {file} to archive")
+            self._compress_zip()
         else:
             raise ValueError(f"Unknown compression type: {self.compression_type.value}")
 
+    def _compress_zip(self):
+        # Every ZIP member is an independent deflate stream, so members are
+        # compressed in parallel across processes (chunk-based parallel
+        # deflate) and written serially in walk order. Very large files are
+        # split into parts that are deflated in parallel as well.
+        with tempfile.TemporaryDirectory(dir=self.backup_path) as spool, open(
+            self.backup_file, "wb"
+        ) as raw, ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            batches = _batch_tasks(self._zip_tasks(spool))
+            writer = _ZipWriter(raw)
+            parts = []
+            parts_crc = parts_size = 0
+            for results in _bounded_map(
+                executor, _deflate_batch, batches, 2 * (os.cpu_count() or 1)
+            ):
+                for result in results:
+                    _, arcname, mode, mtime, method, crc, size, payload, last = result
+                    if parts or not last:
+                        parts.append(payload)
+                        parts_crc = _crc32_combine(parts_crc, crc, size)
+                        parts_size += size
+                        if not last:
+                            continue
+                        crc, size, payload = parts_crc, parts_size, parts
+                        parts = []
+                        parts_crc = parts_size = 0
+                    writer.add(arcname, mode, mtime, method, crc, size, payload)
+                    for part in payload if isinstance(payload, list) else [payload]:
+                        if isinstance(part, Path) and str(part.parent) == spool:
+                            part.unlink()
+                    logging.debug(f"Added {arcname} to archive")
+            writer.close()
+
+    def _zip_tasks(self, spool: str):
+        prefix = self.source.name + "/"
+        level = self.compression_level
+        for idx, (entry, rel) in enumerate(self._archive_entries()):
+            st = entry.stat()
+            task = (
+                idx,
+                entry.path,
+                prefix + rel,
+                st.st_mode,
+                st.st_mtime,
+                st.st_size,
+                level,
+                spool,
+            )
+            if (
+                st.st_size <= _SPLIT_SIZE
+                or not stat.S_ISREG(st.st_mode)
+                or os.path.splitext(entry.path)[1].lower() in _INCOMPRESSIBLE
+                or not _is_compressible(entry.path, _member_level(level, st.st_size))
+            ):
+                yield task + (None,)
+                continue
+            for offset in range(0, st.st_size, _SPLIT_SIZE):
+                length = min(_SPLIT_SIZE, st.st_size - offset)
+                yield task + ((offset, length, offset + length >= st.st_size),)
+
     def _move(self):
         dest = self.backup_path / self.source.name
         logging.debug(f"Moving {self.source.path} to {dest}")
         if dest.exists():
             logging.warning(f"Destination '{dest}' already exists. Skipping move.")
+            self.files = None
         else:
-            shutil.copytree(self.source.path, dest)
+            _fast_copytree(self.source.path, dest, self._archive_entries())
 
     def __repr__(self) -> str:
         size_str = (
@@ -171,7 +1026,8 @@ class BackupArchive:
             f"Backup File: {backup_file_str}\n"
             f"Compressed: {'Yes' if self.compressed else 'No'}\n"
             f"Size: {size_str}\n"
-            f"Backup Date: {self.backup_date.strftime('%Y-%m-%d %H:%M')}"
+            f"Backup Date: {self._date_str[:10]} "
+            f"{self._date_str[11:13]}:{self._date_str[13:15]}"
         )
 
     def __str__(self):
@@ -1,7 +1,8 @@
 import logging
 from pathlib import Path
+from sqlalchemy import insert, select
 from core import SourceDirectory, BackupArchive, CompressionType
-from models import DatabaseManager, DirectoryModel, BackupModel
+from models import get_db, DirectoryModel, BackupModel, FileModel
 
 
 class BackupManager:
@@ -11,9 +12,10 @@ class BackupManager:
         calculate_size: bool,
         compressed: bool,
         compression_type: CompressionType = CompressionType.ZIP,
+        incremental: bool = False,
     ):
         try:
-            self.db = DatabaseManager()
+            self.db = get_db()
             self.session = self.db.get_session()
 
             if isinstance(path, str):
@@ -21,44 +23,98 @@ class BackupManager:
 
             self.source_dir = SourceDirectory(path, calculate_size)
             self.backup_archive = BackupArchive(
-                self.source_dir, compressed, compression_type=compression_type
+                self.source_dir,
+                compressed,
+                compression_type=compression_type,
+                previous_files=self._load_previous_files() if incremental else None,
             )
             logging.debug(f"Backup archive: {self.backup_archive}")
         except Exception as e:
             logging.error(f"BackupManager initialization failed: {e}")
             raise
 
-    def save_backup_metadata(self):
-        try:
-            dir_mod = DirectoryModel(
-                name=self.source_dir.name,
-                path=str(self.source_dir.path),
-                size=self.source_dir.size,
-                date=self.source_dir.date,
+    def _load_previous_files(self) -> dict:
+        previous_id = self.session.scalar(
+            select(FileModel.directory_id)
+            .join(DirectoryModel)
+            .where(DirectoryModel.path == str(self.source_dir.path))
+            .order_by(FileModel.directory_id.desc())
+            .limit(1)
+        )
+        if previous_id is None:
+            logging.info("No previous file state found, backing up everything.")
+            return {}
+        rows = self.session.execute(
+            select(FileModel.rel_path, FileModel.mtime_ns, FileModel.size).where(
+                FileModel.directory_id == previous_id
             )
-            self.session.add(dir_mod)
-            self.session.flush()
-            logging.debug(f"Directory metadata saved: {dir_mod}")
+        )
+        return {rel_path: (mtime_ns, size) for rel_path, mtime_ns, size in rows}
 
-            backup_mod = BackupModel(
-                directory_id=dir_mod.id,
-                backup_name=self.backup_archive.backup_name,
-                backup_path=str(self.backup_archive.backup_path),
-                backup_size=self.backup_archive.compressed_size,
-                backup_date=self.backup_archive.backup_date,
-                compressed=self.backup_archive.compressed,
-                compression_type=(
-                    self.backup_archive.compression_type.value
-                    if self.backup_archive.compressed
-                    else None
+    def save_backup_metadata(self):
+        self.save_many([self])
+
+    @classmethod
+    def save_many(cls, managers: list["BackupManager"]):
+        """Save the metadata of several backups in a single transaction."""
+        if not managers:
+            return
+        session = get_db().get_session()
+        try:
+            directory_ids = session.scalars(
+                insert(DirectoryModel).returning(
+                    DirectoryModel.id, sort_by_parameter_order=True
                 ),
-                compressed_size=self.backup_archive.compressed_size,
+                [
+                    {
+                        "name": m.source_dir.name,
+                        "path": str(m.source_dir.path),
+                        "size": m.source_dir.size,
+                        "date": m.source_dir.date,
+                    }
+                    for m in managers
+                ],
+            ).all()
+            logging.debug(f"Directory metadata saved: {directory_ids}")
+
+            session.execute(
+                insert(BackupModel),
+                [
+                    {
+                        "directory_id": directory_id,
+                        "backup_name": m.backup_archive.backup_name,
+                        "backup_path": str(m.backup_archive.backup_path),
+                        "backup_size": m.backup_archive.compressed_size,
+                        "backup_date": m.backup_archive.backup_date,
+                        "compressed": m.backup_archive.compressed,
+                        "compression_type": (
+                            m.backup_archive.compression_type.value
+                            if m.backup_archive.compressed
+                            else None
+                        ),
+                        "compressed_size": m.backup_archive.compressed_size,
+                    }
+                    for directory_id, m in zip(directory_ids, managers)
+                ],
             )
-            self.session.add(backup_mod)
-            self.session.commit()
+            file_rows = [
+                {
+                    "directory_id": directory_id,
+                    "rel_path": rel_path,
+                    "mtime_ns": mtime_ns,
+                    "size": size,
+                }
+                for directory_id, m in zip(directory_ids, managers)
+                # files is None when archiving failed; recording that state
+                # would make the next incremental run skip unarchived files.
+                for rel_path, mtime_ns, size in m.backup_archive.files or ()
+            ]
+            if file_rows:
+                session.execute(insert(FileModel), file_rows)
+            session.commit()
             logging.info("Backup metadata saved successfully.")
         except Exception as e:
-            self.session.rollback()
+            session.rollback()
             logging.error(f"Failed to save backup metadata: {e}")
             raise
 
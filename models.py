@@ -1,3 +1,4 @@
+import functools
 from sqlalchemy import (
     Column,
     Integer,
@@ -6,6 +7,7 @@ from sqlalchemy import (
     ForeignKey,
     Boolean,
     create_engine,
+    event,
 )
 from sqlalchemy.orm import declarative_base, relationship, sessionmaker
 
@@ -20,6 +22,7 @@ class DirectoryModel(Base):
     size = Column(Integer)
     date = Column(DateTime)
     backups = relationship("BackupModel", back_populates="directory")
+    files = relationship("FileModel", back_populates="directory")
 
 
 class BackupModel(Base):
@@ -36,14 +39,45 @@ class BackupModel(Base):
     directory = relationship("DirectoryModel", back_populates="backups")
 
 
+class FileModel(Base):
+    __tablename__ = "files"
+    id = Column(Integer, primary_key=True)
+    directory_id = Column(Integer, ForeignKey("directories.id"), index=True)
+    rel_path = Column(String)
+    mtime_ns = Column(Integer)
+    size = Column(Integer)
+    content_sha256 = Column(String, nullable=True)
+    directory = relationship("DirectoryModel", back_populates="files")
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
+engine = create_engine(
+    "sqlite:///backups.db", connect_args={"check_same_thread": False}
+)
+event.listen(engine, "connect", _set_sqlite_pragmas)
+Session = sessionmaker(bind=engine)
+
+
 class DatabaseManager:
     def __init__(self):
-        self.engine = create_engine("sqlite:///backups.db")
-        self.Session = sessionmaker(bind=self.engine)
-        self.session = self.Session()
+        self.engine = engine
+        self.session = Session()
 
     def create_db(self):
         Base.metadata.create_all(self.engine)
 
     def get_session(self):
         return self.session
+
+
+@functools.lru_cache(maxsize=None)
+def get_db() -> DatabaseManager:
+    return DatabaseManager()
@@ -0,0 +1,149 @@
+import io
+import os
+import random
+import tempfile
+import unittest
+import zipfile
+import zlib
+from pathlib import Path
+from unittest import mock
+
+import core
+
+
+def _text(size: int, seed: int = 0) -> bytes:
+    rng = random.Random(seed)
+    words = [b"backup", b"archive", b"source", b"directory", b"member", b"deflate"]
+    out = bytearray()
+    while len(out) < size:
+        out += rng.choice(words) + b" %d\n" % rng.randrange(1000)
+    return bytes(out[:size])
+
+
+class ZipArchiveTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.src = self.root / "src"
+        self.src.mkdir()
+
+    def _archive(self) -> zipfile.ZipFile:
+        archive = core.BackupArchive(
+            core.SourceDirectory(self.src),
+            True,
+            backup_path=self.root / "out",
+            compression_type=core.CompressionType.ZIP,
+        )
+        self.assertIsNotNone(archive.compressed_size)
+        zf = zipfile.ZipFile(archive.backup_file)
+        self.addCleanup(zf.close)
+        self.assertIsNone(zf.testzip())
+        return zf
+
+    def _assert_round_trip(self, zf: zipfile.ZipFile):
+        expected = {
+            "src/" + p.relative_to(self.src).as_posix(): p for p in self.src.rglob("*")
+        }
+        names = {name.rstrip("/") for name in zf.namelist()}
+        self.assertEqual(names, set(expected))
+        for info in zf.infolist():
+            path = expected[info.filename.rstrip("/")]
+            if path.is_dir():
+                self.assertTrue(info.is_dir())
+            else:
+                self.assertEqual(zf.read(info), path.read_bytes())
+
+    def test_members(self):
+        (self.src / "text.txt").write_bytes(_text(200_000))
+        (self.src / "small.txt").write_bytes(b"hello\n")
+        (self.src / "photo.jpg").write_bytes(os.urandom(100_000))
+        (self.src / "random.bin").write_bytes(os.urandom(200_000))
+        (self.src / "empty").touch()
+        (self.src / "nested" / "deeper").mkdir(parents=True)
+        (self.src / "nested" / "deeper" / "file.txt").write_bytes(_text(5_000, 1))
+        (self.src / "empty_dir").mkdir()
+        zf = self._archive()
+        self._assert_round_trip(zf)
+        methods = {info.filename: info.compress_type for info in zf.infolist()}
+        self.assertEqual(methods["src/text.txt"], zipfile.ZIP_DEFLATED)
+        self.assertEqual(methods["src/photo.jpg"], zipfile.ZIP_STORED)
+        self.assertEqual(methods["src/random.bin"], zipfile.ZIP_STORED)
+        self.assertEqual(methods["src/empty"], zipfile.ZIP_STORED)
+        self.assertIn("src/empty_dir/", methods)
+
+    def test_zlib_fallback(self):
+        (self.src / "text.txt").write_bytes(_text(200_000))
+        (self.src / "small.txt").write_bytes(b"hello\n")
+        with mock.patch.object(core, "deflate", None):
+            self._assert_round_trip(self._archive())
+
+    def test_non_ascii_names(self):
+        (self.src / "résumé.txt").write_bytes(b"cv\n")
+        (self.src / "日本").mkdir()
+        (self.src / "日本" / "ファイル.txt").write_bytes(_text(10_000))
+        zf = self._archive()
+        self._assert_round_trip(zf)
+        for info in zf.infolist():
+            if not info.filename.isascii():
+                self.assertTrue(info.flag_bits & 0x800)
+
+    def test_split_member(self):
+        (self.src / "large.txt").write_bytes(_text(1_000_000))
+        (self.src / "after.txt").write_bytes(b"after\n")
+        with mock.patch.object(core, "_SPLIT_SIZE", 256 * 1024), mock.patch.object(
+            core, "_crc32_combine", wraps=core._crc32_combine
+        ) as combine:
+            zf = self._archive()
+        self.assertEqual(combine.call_count, 4)
+        self._assert_round_trip(zf)
+        self.assertEqual(
+            zf.getinfo("src/large.txt").compress_type, zipfile.ZIP_DEFLATED
+        )
+
+    def test_spooled_member(self):
+        (self.src / "large.txt").write_bytes(_text(3_000_000))
+        with mock.patch.object(core, "_SPOOL_SIZE", 1024):
+            self._assert_round_trip(self._archive())
+
+
+class ZipWriterTest(unittest.TestCase):
+    def test_many_entries(self):
+        buf = io.BytesIO()
+        writer = core._ZipWriter(buf)
+        data = b"data"
+        count = 0x10000 + 10
+        for i in range(count):
+            writer.add(
+                f"f{i}", 0o100644, 1e9, zipfile.ZIP_STORED, zlib.crc32(data), 4, data
+            )
+        writer.close()
+        with zipfile.ZipFile(buf) as zf:
+            self.assertEqual(len(zf.infolist()), count)
+            self.assertEqual(zf.read(f"f{count - 1}"), data)
+
+    def test_stored_source_changed_size(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "file.bin"
+            path.write_bytes(os.urandom(300_000))
+            for scanned in (300_000, 100_000, 500_000):
+                buf = io.BytesIO()
+                writer = core._ZipWriter(buf)
+                writer.add(
+                    "file.bin", 0o100644, 1e9, zipfile.ZIP_STORED, 0, scanned, path
+                )
+                writer.close()
+                with zipfile.ZipFile(buf) as zf:
+                    self.assertIsNone(zf.testzip())
+                    self.assertEqual(zf.read("file.bin"), path.read_bytes()[:scanned])
+
+    def test_crc32_combine(self):
+        a, b = os.urandom(1000), os.urandom(777)
+        self.assertEqual(
+            core._crc32_combine(zlib.crc32(a), zlib.crc32(b), len(b)),
+            zlib.crc32(a + b),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()